@@ -1,12 +1,54 @@
-import gzip
+import functools
+import gc
+import importlib.util
+import logging
+import mmap
+import os
 import pickle
-import pandas as pd
-from flask import Flask
+import queue
+import threading
+import time
+import warnings
+from concurrent.futures import Future
+from typing import Annotated, Literal
+
+# Must run before NumPy/scikit-learn load their native thread pools: each
+# Gunicorn worker predicts on one thread and scaling comes from more workers
+for thread_count_variable in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+    os.environ.setdefault(thread_count_variable, '1')
+
+import msgpack
+import msgspec
+import numpy as np
+import orjson
+import zstandard
+try:
+    import tl2cgen
+except ImportError:
+    tl2cgen = None
+from flask import Flask, Response, make_response, request
+from flask.json.provider import JSONProvider
 from flask_restx import Api, Resource, fields
 from flask_cors import CORS
 
 
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+    format='%(asctime)s %(levelname)s [%(name)s] %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+orjson_serialization_options = orjson.OPT_NON_STR_KEYS
+
+class OrjsonProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson_serialization_options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 flask_application = Flask(__name__)
+flask_application.json = OrjsonProvider(flask_application)
 CORS(flask_application, origins=["*"])  
 
 crop_yield_api = Api(
@@ -46,26 +88,171 @@ prediction_namespace = crop_yield_api.namespace(
     path='/api/v1'
 )
 
+@crop_yield_api.representation('application/json')
+def output_orjson(data, code, headers=None):
+    response = make_response(orjson.dumps(data, option=orjson_serialization_options), code)
+    response.headers.extend(headers or {})
+    response.mimetype = 'application/json'
+    return response
+
+@crop_yield_api.representation('application/msgpack')
+def output_msgpack(data, code, headers=None):
+    response = make_response(msgpack.packb(data), code)
+    response.headers.extend(headers or {})
+    response.mimetype = 'application/msgpack'
+    return response
+
+model_directory = os.path.dirname(os.path.abspath(__file__))
+compressed_model_path = os.path.join(model_directory, 'optimal_crop_yield_model.pkl.zst')
+uncompressed_model_path = os.path.join(model_directory, 'optimal_crop_yield_model.pkl')
+onnx_model_path = os.path.join(model_directory, 'optimal_crop_yield_model.onnx')
+treelite_library_path = os.path.join(model_directory, 'optimal_crop_yield_model.so')
+
+def cache_uncompressed_model(model_bytes):
+    temporary_model_path = f'{uncompressed_model_path}.{os.getpid()}.tmp'
+    try:
+        with open(temporary_model_path, 'wb') as cache_file:
+            cache_file.write(model_bytes)
+        os.replace(temporary_model_path, uncompressed_model_path)
+    except OSError:
+        # Read-only deployments simply decompress again on the next start
+        if os.path.exists(temporary_model_path):
+            os.remove(temporary_model_path)
+
 def initialize_prediction_model():
     try:
-        with gzip.open('optimal_crop_yield_model.pkl.gz', 'rb') as model_file:
-            complete_model_package = pickle.load(model_file)
-        return complete_model_package
+        if (os.path.exists(uncompressed_model_path)
+                and os.path.getmtime(uncompressed_model_path) >= os.path.getmtime(compressed_model_path)):
+            with open(uncompressed_model_path, 'rb') as model_file:
+                with mmap.mmap(model_file.fileno(), 0, access=mmap.ACCESS_READ) as model_buffer:
+                    return pickle.loads(model_buffer)
+        
+        # Decompressing into memory first is far faster than unpickling off a stream
+        with open(compressed_model_path, 'rb') as compressed_model_file:
+            model_bytes = zstandard.ZstdDecompressor().decompress(compressed_model_file.read())
+        cache_uncompressed_model(model_bytes)
+        return pickle.loads(model_bytes)
     except FileNotFoundError:
-        raise FileNotFoundError("Model file 'optimal_crop_yield_model.pkl.gz' not found. Please ensure the model is trained and saved.")
+        raise FileNotFoundError("Model file 'optimal_crop_yield_model.pkl.zst' not found. Please ensure the model is trained and saved.")
     except Exception as e:
         raise Exception(f"Error loading model: {str(e)}")
 
-print("🔄 Loading trained crop yield prediction model...")
+logger.info("🔄 Loading trained crop yield prediction model...")
 complete_model_data = initialize_prediction_model()
 
+# Keep only what the API serves; the rest of the training artifact is released
+retained_model_keys = (
+    'model', 'region_encoder', 'soil_encoder', 'crop_encoder', 'weather_encoder',
+    'model_name', 'training_date'
+)
+complete_model_data = {key: complete_model_data[key] for key in retained_model_keys if key in complete_model_data}
+
 trained_ml_model = complete_model_data['model']
+if hasattr(trained_ml_model, 'n_jobs'):
+    trained_ml_model.n_jobs = 1
 geographic_region_encoder = complete_model_data['region_encoder'] 
 soil_type_encoder = complete_model_data['soil_encoder']          
 crop_variety_encoder = complete_model_data['crop_encoder']       
 weather_condition_encoder = complete_model_data['weather_encoder']
 
-print(f"✅ Model loaded successfully: {complete_model_data.get('model_name', 'Unknown Model')}")
+def build_case_insensitive_lookup(label_encoder):
+    return {class_name.strip().lower(): class_index for class_index, class_name in enumerate(label_encoder.classes_)}
+
+geographic_region_lookup = build_case_insensitive_lookup(geographic_region_encoder)
+soil_type_lookup = build_case_insensitive_lookup(soil_type_encoder)
+crop_variety_lookup = build_case_insensitive_lookup(crop_variety_encoder)
+weather_condition_lookup = build_case_insensitive_lookup(weather_condition_encoder)
+categorical_feature_choices = {
+    'Region': geographic_region_encoder.classes_.tolist(),
+    'Soil_Type': soil_type_encoder.classes_.tolist(),
+    'Crop': crop_variety_encoder.classes_.tolist(),
+    'Weather_Condition': weather_condition_encoder.classes_.tolist()
+}
+boolean_feature_mapping = {'TRUE': 1, 'FALSE': 0, 'True': 1, 'False': 0, 'true': 1, 'false': 0}
+
+required_feature_columns = [
+    'Region', 'Soil_Type', 'Crop', 'Rainfall_mm', 'Temperature_Celsius',
+    'Fertilizer_Used', 'Irrigation_Used', 'Weather_Condition', 'Days_to_Harvest'
+]
+
+# Features are fed to the model as float32 NumPy arrays, the dtype the tree
+# ensemble casts to internally, so predict() never has to copy its input
+if trained_ml_model.n_features_in_ != len(required_feature_columns):
+    raise Exception(f"Model expects {trained_ml_model.n_features_in_} features, API provides {len(required_feature_columns)}")
+
+def is_onnx_model_usable():
+    if importlib.util.find_spec('onnxruntime') is None or not os.path.exists(onnx_model_path):
+        return False
+    if os.path.getmtime(onnx_model_path) < os.path.getmtime(compressed_model_path):
+        logger.warning("⚠️ Ignoring ONNX model older than the trained model; re-run export_onnx_model.py")
+        return False
+    return True
+
+def initialize_onnx_session():
+    # onnxruntime is not fork-safe: importing it in the preloading Gunicorn
+    # master makes workers hang or abort on exit, so each process loads it here
+    import onnxruntime
+    
+    # Parallelism comes from Gunicorn worker processes, not intra-op threads
+    session_options = onnxruntime.SessionOptions()
+    session_options.intra_op_num_threads = 1
+    session_options.inter_op_num_threads = 1
+    return onnxruntime.InferenceSession(
+        onnx_model_path,
+        sess_options=session_options,
+        providers=['CPUExecutionProvider']
+    )
+
+onnx_session_lock = threading.Lock()
+onnx_session_process_id = None
+onnx_inference_session = None
+
+def get_onnx_inference_session():
+    global onnx_inference_session, onnx_session_process_id
+    
+    if onnx_session_process_id != os.getpid():
+        with onnx_session_lock:
+            if onnx_session_process_id != os.getpid():
+                onnx_inference_session = initialize_onnx_session()
+                onnx_session_process_id = os.getpid()
+    return onnx_inference_session
+
+def initialize_treelite_predictor():
+    if tl2cgen is None or not os.path.exists(treelite_library_path):
+        return None
+    if os.path.getmtime(treelite_library_path) < os.path.getmtime(compressed_model_path):
+        logger.warning("⚠️ Ignoring Treelite library older than the trained model; re-run export_treelite_model.py")
+        return None
+    
+    return tl2cgen.Predictor(treelite_library_path, nthread=1)
+
+requested_inference_backend = os.environ.get('INFERENCE_BACKEND', 'auto').lower()
+treelite_predictor = None
+
+if requested_inference_backend in ('auto', 'treelite'):
+    treelite_predictor = initialize_treelite_predictor()
+
+if treelite_predictor is not None:
+    active_inference_backend = 'treelite'
+elif requested_inference_backend in ('auto', 'onnx') and is_onnx_model_usable():
+    active_inference_backend = 'onnx'
+else:
+    active_inference_backend = 'sklearn'
+
+if requested_inference_backend not in ('auto', active_inference_backend):
+    raise Exception(f"INFERENCE_BACKEND={requested_inference_backend} is unavailable. Install its runtime and run export_{requested_inference_backend}_model.py first.")
+
+logger.info(
+    "✅ Model loaded successfully: %s (%s backend)",
+    complete_model_data.get('model_name', 'Unknown Model'),
+    active_inference_backend
+)
+
+# A worker never has more requests in flight than it has threads
+max_prediction_batch_size = max(1, int(os.environ.get('MAX_BATCH_SIZE', os.environ.get('GUNICORN_THREADS', 4))))
+prediction_result_timeout = float(os.environ.get('PREDICTION_TIMEOUT_SECONDS', 10))
+# Opt-in: cached predictions are computed on rounded inputs (see quantize_feature_row)
+prediction_cache_size = max(0, int(os.environ.get('PREDICTION_CACHE_SIZE', 0)))
 
 agricultural_input_schema = crop_yield_api.model('CropYieldPredictionInput', {
     'Region': fields.String(
@@ -105,15 +292,15 @@ agricultural_input_schema = crop_yield_api.model('CropYieldPredictionInput', {
         required=True, 
         description='🧪 Whether chemical or organic fertilizers were applied',
         example='TRUE',
-        enum=['TRUE', 'FALSE', 'true', 'false'],
-        help='Boolean indicator: TRUE/FALSE (case insensitive)'
+        enum=['TRUE', 'FALSE', 'True', 'False', 'true', 'false'],
+        help='Boolean indicator: TRUE/FALSE, True/False or true/false'
     ),
     'Irrigation_Used': fields.String(
         required=True, 
         description='💧 Whether artificial irrigation systems were employed',
         example='FALSE',
-        enum=['TRUE', 'FALSE', 'true', 'false'],
-        help='Boolean indicator: TRUE/FALSE (case insensitive)'
+        enum=['TRUE', 'FALSE', 'True', 'False', 'true', 'false'],
+        help='Boolean indicator: TRUE/FALSE, True/False or true/false'
     ),
     'Weather_Condition': fields.String(
         required=True, 
@@ -131,6 +318,20 @@ agricultural_input_schema = crop_yield_api.model('CropYieldPredictionInput', {
     )
 })
 
+# Mirrors agricultural_input_schema, which is kept only for the Swagger docs
+class AgriculturalInputPayload(msgspec.Struct):
+    Region: str
+    Soil_Type: str
+    Crop: str
+    Rainfall_mm: Annotated[float, msgspec.Meta(ge=0)]
+    Temperature_Celsius: Annotated[float, msgspec.Meta(ge=-10, le=50)]
+    Fertilizer_Used: Literal['TRUE', 'FALSE', 'True', 'False', 'true', 'false']
+    Irrigation_Used: Literal['TRUE', 'FALSE', 'True', 'False', 'true', 'false']
+    Weather_Condition: str
+    Days_to_Harvest: Annotated[int, msgspec.Meta(ge=30, le=365)]
+
+agricultural_input_decoder = msgspec.json.Decoder(AgriculturalInputPayload)
+
 prediction_response_schema = crop_yield_api.model('CropYieldPredictionResponse', {
     'predicted_yield_tons_per_hectare': fields.Float(
         description='🎯 Predicted crop yield in tons per hectare',
@@ -166,69 +367,224 @@ error_response_schema = crop_yield_api.model('ErrorResponse', {
     )
 })
 
+def encode_categorical_value(category_value, lookup_table, feature_name):
+    try:
+        return lookup_table[category_value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"{feature_name}={category_value!r} not supported; choices={categorical_feature_choices[feature_name]}")
+
+def parse_boolean_flag(flag_value):
+    # AgriculturalInputPayload's Literal already limits flag_value to the mapping's keys
+    return boolean_feature_mapping[flag_value]
+
 def transform_agricultural_input(raw_input_data):
-    if isinstance(raw_input_data, dict):
-        processed_dataframe = pd.DataFrame([raw_input_data])
-    else:
-        processed_dataframe = raw_input_data.copy()
+    # Column order matches required_feature_columns
+    feature_row = np.empty((1, 9), dtype=np.float32)
     
+    feature_row[0, 0] = encode_categorical_value(raw_input_data['Region'], geographic_region_lookup, 'Region')
+    feature_row[0, 1] = encode_categorical_value(raw_input_data['Soil_Type'], soil_type_lookup, 'Soil_Type')
+    feature_row[0, 2] = encode_categorical_value(raw_input_data['Crop'], crop_variety_lookup, 'Crop')
+    feature_row[0, 3] = raw_input_data['Rainfall_mm']
+    feature_row[0, 4] = raw_input_data['Temperature_Celsius']
+    feature_row[0, 5] = parse_boolean_flag(raw_input_data['Fertilizer_Used'])
+    feature_row[0, 6] = parse_boolean_flag(raw_input_data['Irrigation_Used'])
+    feature_row[0, 7] = encode_categorical_value(raw_input_data['Weather_Condition'], weather_condition_lookup, 'Weather_Condition')
+    feature_row[0, 8] = raw_input_data['Days_to_Harvest']
     
-    text_features_to_standardize = ['Region', 'Soil_Type', 'Crop', 'Weather_Condition']
-    for feature_name in text_features_to_standardize:
-        processed_dataframe[feature_name] = processed_dataframe[feature_name].str.strip().str.title()
+    # Values beyond float32 range (e.g. Rainfall_mm=1e39) become inf here
+    if not np.isfinite(feature_row).all():
+        raise ValueError("Numerical features must be finite and within float32 range")
+    
+    return feature_row
+
+def calculate_prediction_confidence(prediction_value):
+    if 0 <= prediction_value <= 10:
+        return "High"
+    elif 10 < prediction_value <= 20:
+        return "Medium"
+    else:
+        return "Low"
+
+pending_prediction_queue = queue.Queue()
+batch_worker_lock = threading.Lock()
+batch_worker_thread = None
+
+# The model was fitted on a DataFrame; plain NumPy rows are in the same column order.
+# Installed once here: catch_warnings() per call would swap the process-wide filter
+# list underneath the other request threads
+warnings.filterwarnings('ignore', message='X does not have valid feature names', category=UserWarning)
+
+def predict_crop_yield(feature_matrix):
+    if treelite_predictor is not None:
+        # tl2cgen misreads strided single-row views, so it always gets a C-ordered copy
+        treelite_matrix = tl2cgen.DMatrix(np.ascontiguousarray(feature_matrix))
+        return treelite_predictor.predict(treelite_matrix).reshape(-1)
+    if active_inference_backend == 'onnx':
+        return get_onnx_inference_session().run(None, {'X': feature_matrix})[0].reshape(-1)
     
+    return trained_ml_model.predict(feature_matrix)
+
+def process_prediction_batch(pending_batch, batch_feature_buffer):
+    batch_size = len(pending_batch)
     
     try:
-        processed_dataframe['Region'] = geographic_region_encoder.transform(processed_dataframe['Region'])
-        processed_dataframe['Soil_Type'] = soil_type_encoder.transform(processed_dataframe['Soil_Type'])
-        processed_dataframe['Crop'] = crop_variety_encoder.transform(processed_dataframe['Crop'])
-        processed_dataframe['Weather_Condition'] = weather_condition_encoder.transform(processed_dataframe['Weather_Condition'])
-    except ValueError as encoding_error:
-        raise ValueError(f"Categorical encoding failed: {str(encoding_error)}. Please check that all categorical values are supported.")
-    
-    boolean_feature_mapping = {'TRUE': 1, 'FALSE': 0}
+        # Filled column by column into the column-major buffer reused across batches
+        batch_columns = zip(*(feature_values for _, feature_values in pending_batch))
+        for column_index, column_values in enumerate(batch_columns):
+            batch_feature_buffer[:batch_size, column_index] = column_values
+        batch_predictions = predict_crop_yield(batch_feature_buffer[:batch_size])
+    except Exception as batch_error:
+        for result_future, _ in pending_batch:
+            result_future.set_exception(batch_error)
+        return
     
-    processed_dataframe['Fertilizer_Used'] = (
-        processed_dataframe['Fertilizer_Used']
-        .astype(str)
-        .str.upper()
-        .str.strip()
-        .map(boolean_feature_mapping)
+    for (result_future, _), prediction_value in zip(pending_batch, batch_predictions):
+        result_future.set_result(prediction_value)
+
+def run_batched_inference_loop():
+    batch_feature_buffer = np.empty(
+        (max_prediction_batch_size, len(required_feature_columns)),
+        dtype=np.float32,
+        order='F'
     )
     
-    processed_dataframe['Irrigation_Used'] = (
-        processed_dataframe['Irrigation_Used']
-        .astype(str)
-        .str.upper()
-        .str.strip()
-        .map(boolean_feature_mapping)
-    )
+    while True:
+        pending_batch = [pending_prediction_queue.get()]
+        
+        # Take whatever queued up during the previous predict and send it at once;
+        # a lone request is never held back waiting for company
+        while len(pending_batch) < max_prediction_batch_size:
+            try:
+                pending_batch.append(pending_prediction_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        process_prediction_batch(pending_batch, batch_feature_buffer)
+
+def ensure_batch_worker_running():
+    global batch_worker_thread
     
-    if processed_dataframe['Fertilizer_Used'].isna().any() or processed_dataframe['Irrigation_Used'].isna().any():
-        raise ValueError("Boolean features must be 'TRUE' or 'FALSE' (case insensitive)")
+    # Threads do not survive fork(), so each worker process starts its own batcher;
+    # a batcher that died for any reason is replaced the same way
+    if batch_worker_thread is not None and batch_worker_thread.is_alive():
+        return
+    with batch_worker_lock:
+        if batch_worker_thread is None or not batch_worker_thread.is_alive():
+            batch_worker_thread = threading.Thread(
+                target=run_batched_inference_loop,
+                name='crop-yield-batcher',
+                daemon=True
+            )
+            batch_worker_thread.start()
+
+def submit_prediction_request(feature_values):
+    ensure_batch_worker_running()
+    result_future = Future()
+    pending_prediction_queue.put((result_future, feature_values))
+    return result_future
+
+def wait_for_crop_yield_prediction(feature_values):
+    return submit_prediction_request(feature_values).result(timeout=prediction_result_timeout)
+
+def quantize_feature_row(feature_row):
+    region, soil_type, crop, rainfall_mm, temperature_celsius, fertilizer_used, irrigation_used, weather_condition, days_to_harvest = feature_row[0].tolist()
     
+    # Rainfall to 1 mm, temperature to 0.1 °C and harvest time to 1 day
+    return (
+        int(region), int(soil_type), int(crop),
+        round(rainfall_mm), round(temperature_celsius * 10),
+        int(fertilizer_used), int(irrigation_used), int(weather_condition),
+        round(days_to_harvest)
+    )
+
+@functools.lru_cache(maxsize=prediction_cache_size)
+def predict_quantized_crop_yield(region, soil_type, crop, rainfall_mm, temperature_tenths,
+                                 fertilizer_used, irrigation_used, weather_condition, days_to_harvest):
+    feature_values = (
+        region, soil_type, crop, rainfall_mm, temperature_tenths / 10,
+        fertilizer_used, irrigation_used, weather_condition, days_to_harvest
+    )
+    return wait_for_crop_yield_prediction(feature_values)
+
+def predict_single_crop_yield(feature_row):
+    if prediction_cache_size:
+        return predict_quantized_crop_yield(*quantize_feature_row(feature_row))
+    return wait_for_crop_yield_prediction(tuple(feature_row[0].tolist()))
+
+def generate_crop_yield_prediction(request_body):
+    start_processing_time = time.perf_counter()
     
-    required_feature_columns = [
-        'Region', 'Soil_Type', 'Crop', 'Rainfall_mm', 'Temperature_Celsius',
-        'Fertilizer_Used', 'Irrigation_Used', 'Weather_Condition', 'Days_to_Harvest'
-    ]
+    try:
+        if not request_body.strip():
+            return {
+                'error_message': 'No input data provided in request body',
+                'error_code': 'MISSING_DATA',
+                'suggestions': [
+                    'Include all required agricultural parameters in JSON format',
+                    'Refer to the API documentation for input schema'
+                ]
+            }, 400
+        
+        try:
+            agricultural_input_data = msgspec.structs.asdict(agricultural_input_decoder.decode(request_body))
+        except msgspec.DecodeError as payload_error:
+            return {
+                'error_message': f'Invalid input payload: {str(payload_error)}',
+                'error_code': 'INVALID_PAYLOAD',
+                'suggestions': [
+                    'Include all required fields with the documented types and ranges',
+                    'Check the API documentation for complete field requirements'
+                ]
+            }, 400
+        
+        processed_feature_row = transform_agricultural_input(agricultural_input_data)
+        raw_prediction_result = predict_single_crop_yield(processed_feature_row)
+        
+        # Backends return NumPy scalars; responses carry plain Python floats only
+        final_prediction = max(0.0, float(raw_prediction_result))
+        
+        processing_duration = (time.perf_counter() - start_processing_time) * 1000
+        confidence_assessment = calculate_prediction_confidence(final_prediction)
+        
+        result = {
+            'predicted_yield_tons_per_hectare': round(final_prediction, 3),
+            'confidence_level': confidence_assessment,
+            'model_version': complete_model_data.get('model_name', 'SmartHinga ML Model v1.0'),
+            'processing_time_ms': round(processing_duration, 2)
+        }
+        logger.debug("Prediction result: %s", result)
+        return result, 200
     
-    feature_matrix = processed_dataframe[required_feature_columns]
+    except ValueError as validation_error:
+        return {
+            'error_message': f'Input validation failed: {str(validation_error)}',
+            'error_code': 'VALIDATION_ERROR',
+            'suggestions': [
+                'Check that categorical values are supported by the model',
+                'Ensure boolean fields use TRUE/FALSE values',
+                'Verify numerical ranges are realistic'
+            ]
+        }, 422
     
-    return feature_matrix
-
-def calculate_prediction_confidence(prediction_value):
-    if 0 <= prediction_value <= 10:
-        return "High"
-    elif 10 < prediction_value <= 20:
-        return "Medium"
-    else:
-        return "Low"
+    except Exception as unexpected_error:
+        return {
+            'error_message': f'Prediction processing failed: {str(unexpected_error)}',
+            'error_code': 'PROCESSING_ERROR',
+            'suggestions': [
+                'Verify input data format and values',
+                'Contact support if the error persists',
+                'Check API documentation for troubleshooting'
+            ]
+        }, 500
 
 @prediction_namespace.route('/predict-yield')
 class CropYieldPredictor(Resource):
     @prediction_namespace.doc('generate_crop_yield_prediction')
-    @prediction_namespace.expect(agricultural_input_schema, validate=True)
+    @prediction_namespace.expect(agricultural_input_schema)
+    @prediction_namespace.response(200, 'Prediction generated', prediction_response_schema)
+    @prediction_namespace.response(400, 'Missing body, malformed JSON, or a missing, mistyped or out-of-range field', error_response_schema)
+    @prediction_namespace.response(422, 'Valid input the model cannot encode', error_response_schema)
+    @prediction_namespace.response(500, 'Prediction failed or timed out', error_response_schema)
     def post(self):
         """
         🌾 Generate Crop Yield Prediction
@@ -238,9 +594,9 @@ class CropYieldPredictor(Resource):
         factors including climate, soil conditions, crop variety, and farming practices.
         
         **Process Flow:**
-        1. Validate and standardize input data
-        2. Apply categorical encoding and preprocessing
-        3. Generate prediction using trained ML model
+        1. Validate, standardize and encode input data
+        2. Serve repeated inputs from the quantized prediction cache, if enabled
+        3. Batch cache misses into a single model call
         4. Calculate confidence assessment
         5. Return comprehensive prediction results
         
@@ -258,76 +614,18 @@ class CropYieldPredictor(Resource):
             "Days_to_Harvest": 120
         }
         ```
-        """
-        import time
-        start_processing_time = time.time()
         
-        try:
-            agricultural_input_data = crop_yield_api.payload
-            
-            if not agricultural_input_data:
-                return {
-                    'error_message': 'No input data provided in request body',
-                    'error_code': 'MISSING_DATA',
-                    'suggestions': [
-                        'Include all required agricultural parameters in JSON format',
-                        'Refer to the API documentation for input schema'
-                    ]
-                }, 400
-            
-            required_fields = ['Region', 'Soil_Type', 'Crop', 'Rainfall_mm', 'Temperature_Celsius',
-                             'Fertilizer_Used', 'Irrigation_Used', 'Weather_Condition', 'Days_to_Harvest']
-            
-            missing_fields = [field for field in required_fields if field not in agricultural_input_data]
-            if missing_fields:
-                return {
-                    'error_message': f'Missing required fields: {", ".join(missing_fields)}',
-                    'error_code': 'MISSING_FIELDS',
-                    'suggestions': [
-                        f'Include the following fields: {", ".join(missing_fields)}',
-                        'Check the API documentation for complete field requirements'
-                    ]
-                }, 400
-            
-            processed_feature_matrix = transform_agricultural_input(agricultural_input_data)
-            
-            raw_prediction_result = trained_ml_model.predict(processed_feature_matrix)[0]
-            
-            final_prediction = max(0, float(raw_prediction_result))
-            
-            processing_duration = (time.time() - start_processing_time) * 1000
-            confidence_assessment = calculate_prediction_confidence(final_prediction)
-            
-            result = {
-                'predicted_yield_tons_per_hectare': round(final_prediction, 3),
-                'confidence_level': confidence_assessment,
-                'model_version': complete_model_data.get('model_name', 'SmartHinga ML Model v1.0'),
-                'processing_time_ms': round(processing_duration, 2)
-            }
-            print(f"DEBUG: Prediction result: {result}")
-            return result, 200
-            
-        except ValueError as validation_error:
-            return {
-                'error_message': f'Input validation failed: {str(validation_error)}',
-                'error_code': 'VALIDATION_ERROR',
-                'suggestions': [
-                    'Check that categorical values are supported by the model',
-                    'Ensure boolean fields use TRUE/FALSE values',
-                    'Verify numerical ranges are realistic'
-                ]
-            }, 422
-            
-        except Exception as unexpected_error:
-            return {
-                'error_message': f'Prediction processing failed: {str(unexpected_error)}',
-                'error_code': 'PROCESSING_ERROR',
-                'suggestions': [
-                    'Verify input data format and values',
-                    'Contact support if the error persists',
-                    'Check API documentation for troubleshooting'
-                ]
-            }, 500
+        **Error Responses:**
+        - `400 MISSING_DATA`: empty request body
+        - `400 INVALID_PAYLOAD`: malformed JSON, or a field that is missing, has the
+          wrong type or is out of range. Validation stops at the first problem, and
+          `error_message` names only that field (e.g. "Object missing required field
+          `Region`"). `Days_to_Harvest` must be a JSON integer; `120.0` is rejected
+        - `422 VALIDATION_ERROR`: well-formed values the model cannot encode, such as
+          an unsupported `Region` or a number beyond float32 range
+        - `500 PROCESSING_ERROR`: the prediction failed or timed out
+        """
+        return generate_crop_yield_prediction(request.get_data())
 
 @prediction_namespace.route('/model-info')
 class ModelInformation(Resource):
@@ -351,6 +649,12 @@ class ModelInformation(Resource):
                 'model_name': complete_model_data.get('model_name', 'SmartHinga ML Model'),
                 'model_version': '1.0.1',
                 'training_date': complete_model_data.get('training_date', 'Unknown'),
+                'inference_backend': active_inference_backend,
+                # Each Gunicorn worker keeps its own cache; these counters are this worker's only
+                'worker_prediction_cache': {
+                    'worker_pid': os.getpid(),
+                    **predict_quantized_crop_yield.cache_info()._asdict()
+                },
                 'supported_features': {
                     'regions': supported_regions,
                     'soil_types': supported_soil_types,
@@ -367,6 +671,16 @@ class ModelInformation(Resource):
                 'error_code': 'MODEL_INFO_ERROR'
             }, 500
 
+@flask_application.post('/api/v2/predict-yield-fast')
+def fast_crop_yield_prediction_endpoint():
+    """⚡ Crop Yield Prediction without Flask-RESTX request handling"""
+    response_payload, status_code = generate_crop_yield_prediction(request.get_data())
+    return Response(
+        orjson.dumps(response_payload, option=orjson_serialization_options),
+        status=status_code,
+        mimetype='application/json'
+    )
+
 @flask_application.route('/', methods=['GET'])
 def api_root_endpoint():
     """🏠 API Root Endpoint - Health Check and Basic Information"""
@@ -379,21 +693,14 @@ def api_root_endpoint():
         'health_check': '✅ All systems operational',
         'supported_operations': [
             'POST /api/v1/predict-yield - Generate crop yield predictions',
+            'POST /api/v2/predict-yield-fast - Generate crop yield predictions (lightweight endpoint)',
             'GET /api/v1/model-info - Retrieve model information',
             'GET /documentation/ - Access API documentation'
         ]
     }, 200
 
-if __name__ == '__main__':
-    import os
-
-    server_port = int(os.environ.get('PORT', 5000))
-    debug_mode = os.environ.get('FLASK_ENV') == 'development'
-    
-    print("🚀 Starting SmartHinga Crop Yield Prediction API...")
-    flask_application.run(
-        host='0.0.0.0',
-        port=server_port,
-        debug=debug_mode,
-        threaded=True
-    )
\ No newline at end of file
+# Startup objects live for the whole process; freezing them keeps the garbage
+# collector from touching their pages, so Gunicorn's preloaded workers keep
+# sharing them copy-on-write
+gc.collect()
+gc.freeze()
@@ -0,0 +1,14 @@
+import pytest
+
+from app import flask_application
+
+
+def pytest_configure(config):
+    # pytest restores the warning filters after importing this file, which drops
+    # the one app.py installs at import
+    config.addinivalue_line('filterwarnings', 'ignore:X does not have valid feature names:UserWarning')
+
+
+@pytest.fixture
+def app():
+    return flask_application
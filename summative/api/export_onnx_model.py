@@ -0,0 +1,32 @@
+"""
+Export the trained crop yield regressor to ONNX for onnxruntime inference.
+
+Run from this directory after the model artifact changes (needs the packages
+in requirements-export.txt):
+
+    python export_onnx_model.py
+
+The API picks up optimal_crop_yield_model.onnx automatically on its next start.
+"""
+import os
+
+os.environ['INFERENCE_BACKEND'] = 'sklearn'
+
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+from app import onnx_model_path, required_feature_columns, trained_ml_model
+
+
+def export_onnx_model():
+    onnx_model = convert_sklearn(
+        trained_ml_model,
+        initial_types=[('X', FloatTensorType([None, len(required_feature_columns)]))]
+    )
+    with open(onnx_model_path, 'wb') as onnx_model_file:
+        onnx_model_file.write(onnx_model.SerializeToString())
+    return onnx_model_path
+
+
+if __name__ == '__main__':
+    print(f"✅ ONNX model written to {export_onnx_model()}")
@@ -0,0 +1,33 @@
+"""
+Compile the trained crop yield regressor into a native library with Treelite.
+
+Run from this directory after the model artifact changes (needs gcc and
+the packages in requirements-export.txt):
+
+    python export_treelite_model.py
+
+The API picks up optimal_crop_yield_model.so automatically on its next start.
+"""
+import os
+
+os.environ['INFERENCE_BACKEND'] = 'sklearn'
+
+import tl2cgen
+import treelite
+
+from app import trained_ml_model, treelite_library_path
+
+
+def export_treelite_model():
+    treelite_model = treelite.sklearn.import_model(trained_ml_model)
+    tl2cgen.export_lib(
+        treelite_model,
+        toolchain='gcc',
+        libpath=treelite_library_path,
+        params={'parallel_comp': os.cpu_count() or 1}
+    )
+    return treelite_library_path
+
+
+if __name__ == '__main__':
+    print(f"✅ Treelite library written to {export_treelite_model()}")
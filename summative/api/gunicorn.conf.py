@@ -0,0 +1,12 @@
+import multiprocessing
+import os
+
+wsgi_app = 'app:flask_application'
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Worker processes give CPU-bound predictions real parallelism; preloading
+# loads the model once in the master so forked workers share its pages
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+preload_app = True
@@ -0,0 +1,122 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+import app as crop_yield_app
+
+
+sample_agricultural_input = {
+    'Region': 'North',
+    'Soil_Type': 'Loam',
+    'Crop': 'Wheat',
+    'Rainfall_mm': 450.5,
+    'Temperature_Celsius': 22.5,
+    'Fertilizer_Used': 'TRUE',
+    'Irrigation_Used': 'FALSE',
+    'Weather_Condition': 'Sunny',
+    'Days_to_Harvest': 120
+}
+
+prediction_endpoints = ('/api/v1/predict-yield', '/api/v2/predict-yield-fast')
+
+
+def build_varied_inputs(input_count):
+    return [
+        dict(
+            sample_agricultural_input,
+            Rainfall_mm=200 + 37.3 * input_index,
+            Temperature_Celsius=15 + input_index % 20,
+            Irrigation_Used='TRUE' if input_index % 2 else 'FALSE'
+        )
+        for input_index in range(input_count)
+    ]
+
+
+def request_predicted_yield(client, endpoint, agricultural_input):
+    response = client.post(endpoint, json=agricultural_input)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()['predicted_yield_tons_per_hectare']
+
+
+def test_sample_prediction(client):
+    for endpoint in prediction_endpoints:
+        response = client.post(endpoint, json=sample_agricultural_input)
+
+        assert response.status_code == 200
+        assert response.get_json()['predicted_yield_tons_per_hectare'] == 4.24
+        assert response.get_json()['confidence_level'] == 'High'
+
+
+def test_concurrent_predictions_match_sequential_predictions(app, client):
+    varied_inputs = build_varied_inputs(48)
+    # pytest-flask pushes a request context on the test thread, so workers get their own client
+    worker_clients = threading.local()
+
+    def request_from_worker(endpoint, agricultural_input):
+        if not hasattr(worker_clients, 'client'):
+            worker_clients.client = app.test_client()
+        return request_predicted_yield(worker_clients.client, endpoint, agricultural_input)
+
+    for endpoint in prediction_endpoints:
+        sequential_yields = [
+            request_predicted_yield(client, endpoint, agricultural_input)
+            for agricultural_input in varied_inputs
+        ]
+        with ThreadPoolExecutor(max_workers=16) as request_pool:
+            concurrent_yields = list(request_pool.map(
+                lambda agricultural_input: request_from_worker(endpoint, agricultural_input),
+                varied_inputs
+            ))
+
+        assert concurrent_yields == sequential_yields
+
+
+def test_dead_batcher_is_restarted(client, monkeypatch):
+    crop_yield_app.ensure_batch_worker_running()
+    original_batcher = crop_yield_app.batch_worker_thread
+
+    # SystemExit is not caught by process_prediction_batch, so it ends the batcher thread
+    def stop_batcher(pending_batch, batch_feature_buffer):
+        raise SystemExit
+
+    with monkeypatch.context() as patch:
+        patch.setattr(crop_yield_app, 'process_prediction_batch', stop_batcher)
+        crop_yield_app.pending_prediction_queue.put((Future(), (0,) * 9))
+        original_batcher.join(timeout=5)
+
+    assert not original_batcher.is_alive()
+    assert request_predicted_yield(client, prediction_endpoints[0], sample_agricultural_input) == 4.24
+    assert crop_yield_app.batch_worker_thread is not original_batcher
+    assert crop_yield_app.batch_worker_thread.is_alive()
+
+
+# Rainfall_mm=1e39 overflows float32 on purpose
+@pytest.mark.filterwarnings('ignore:overflow encountered in cast:RuntimeWarning')
+def test_payload_errors_are_400_and_encoding_errors_are_422(client):
+    expected_error_responses = [
+        (b'', 400, 'MISSING_DATA'),
+        (b'{"Region": ', 400, 'INVALID_PAYLOAD'),
+        (b'{}', 400, 'INVALID_PAYLOAD'),
+        (dict(sample_agricultural_input, Days_to_Harvest=120.0), 400, 'INVALID_PAYLOAD'),
+        (dict(sample_agricultural_input, Temperature_Celsius=80), 400, 'INVALID_PAYLOAD'),
+        (dict(sample_agricultural_input, Fertilizer_Used='yes'), 400, 'INVALID_PAYLOAD'),
+        (dict(sample_agricultural_input, Region='Mars'), 422, 'VALIDATION_ERROR'),
+        (dict(sample_agricultural_input, Rainfall_mm=1e39), 422, 'VALIDATION_ERROR'),
+    ]
+
+    for endpoint in prediction_endpoints:
+        for request_payload, expected_status, expected_error_code in expected_error_responses:
+            if isinstance(request_payload, bytes):
+                response = client.post(endpoint, data=request_payload, content_type='application/json')
+            else:
+                response = client.post(endpoint, json=request_payload)
+
+            assert response.status_code == expected_status, request_payload
+            assert response.get_json()['error_code'] == expected_error_code, request_payload
+
+
+def test_missing_fields_report_only_the_first(client):
+    response = client.post(prediction_endpoints[0], json={})
+
+    assert response.get_json()['error_message'] == 'Invalid input payload: Object missing required field `Region`'